@@ -2,6 +2,8 @@
 from django.conf import settings
 from commands.command import MuxCommand
 
+_PERM_HIERARCHY_STR = ", ".join(settings.PERMISSION_HIERARCHY)
+
 
 class CmdAccess(MuxCommand):
     """
@@ -20,10 +22,9 @@ class CmdAccess(MuxCommand):
         """Load the permission groups"""
         char = self.character
         account = self.account
-        hierarchy_full = settings.PERMISSION_HIERARCHY
         info = []  # List of info to output to user
         if 'hierarchy' in self.cmdstring or 'levels' in self.cmdstring:
-            info.append('|wPermission Hierarchy|n (climbing): %s|/' % ", ".join(hierarchy_full))
+            info.append('|wPermission Hierarchy|n (climbing): %s|/' % _PERM_HIERARCHY_STR)
         else:
             pperms = ', '.join(account.permissions.all())
             cperms = (', '.join(char.permissions.all())) if char else None
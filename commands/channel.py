@@ -5,12 +5,15 @@ from evennia/commands/default/comms.py, heavily customized.
 """
 from commands.command import MuxAccountCommand
 from django.conf import settings
-from evennia.comms.models import ChannelDB, Msg
+from evennia.comms.models import ChannelDB
 from evennia.comms.channelhandler import CHANNELHANDLER
-from evennia.utils import create, utils, evtable
-from evennia.utils.utils import make_iter
+from evennia.utils import ansi, evtable, prettytable
+from evennia.utils.utils import crop, make_iter, to_unicode
 
 _DEFAULT_WIDTH = settings.CLIENT_DEFAULT_WIDTH
+_FAST_TABLE_ROWS = 50  # Channel listings longer than this use the faster PrettyTable
+_FAST_TABLE_WIDTHS = (20, _DEFAULT_WIDTH - 57, 12, 12)  # PrettyTable column widths; borders take 13
+_PIPE_STAND_IN = u'\xa6'  # Shown for a literal | in PrettyTable cells; one character wide, unlike ||
 
 
 def find_channel(caller, channel_name, silent=False, noaliases=False):
@@ -36,6 +39,18 @@ def find_channel(caller, channel_name, silent=False, noaliases=False):
     return channels[0]
 
 
+def channel_nicks(caller):
+    """
+    Fetch the caller's channel nicks once and index
+    them by lower-case channel key.
+    """
+    nicks_by_key = {}
+    for nick in make_iter(caller.nicks.get(category="channel", return_obj=True) or []):
+        if nick:
+            nicks_by_key.setdefault(nick.strvalue.lower(), []).append(nick.db_key)
+    return nicks_by_key
+
+
 class CmdChannels(MuxAccountCommand):
     """
     Channels provide communication with a group of other accounts based on a
@@ -84,21 +99,32 @@ class CmdChannels(MuxAccountCommand):
 
         if 'list' in self.switches:
             # full listing (of channels caller is able to listen to) ✔ or ✘
-            com_table = evtable.EvTable("|wchannel|n", "|wdescription|n", "|wown sub send|n",
-                                        "|wmy aliases|n", maxwidth=_DEFAULT_WIDTH)
+            headers = ("|wchannel|n", "|wdescription|n", "|wown sub send|n", "|wmy aliases|n")
+            fast_table = len(channels) > _FAST_TABLE_ROWS
+            if fast_table:  # PrettyTable counts markup as visible, so it gets plain, cropped cells.
+                com_table = prettytable.PrettyTable([ansi.strip_ansi(each) for each in headers])
+                com_table.align = 'l'
+            else:
+                com_table = evtable.EvTable(*headers, maxwidth=_DEFAULT_WIDTH)
+            nicks_by_key = channel_nicks(caller)
+            sub_ids = {chan.id for chan in subs}
             for chan in channels:
                 c_lower = chan.key.lower()
-                nicks = caller.nicks.get(category="channel", return_obj=True)
-                nicks = nicks or []
+                chan_aliases = chan.aliases.all()
                 control = '|gYes|n ' if chan.access(caller, 'control') else '|rNo|n  '
                 send = '|gYes|n ' if chan.access(caller, 'send') else '|rNo|n  '
-                sub = chan in subs and '|gYes|n ' or '|rNo|n  '
-                com_table.add_row(*["%s%s" % (chan.key, chan.aliases.all() and
-                                    "(%s)" % ",".join(chan.aliases.all()) or ''),
-                                    chan.db.desc,
-                                    control + sub + send,
-                                    "%s" % ",".join(nick.db_key for nick in make_iter(nicks)
-                                                    if nick.strvalue.lower() == c_lower)])
+                sub = '|gYes|n ' if chan.id in sub_ids else '|rNo|n  '
+                alias_str = "(%s)" % ",".join(chan_aliases) if chan_aliases else ''
+                row = [chan.key + alias_str,
+                       chan.db.desc,
+                       control + sub + send,
+                       ",".join(nicks_by_key.get(c_lower, ()))]
+                if fast_table:
+                    cells = [crop(to_unicode(ansi.strip_ansi(cell or '')), width=width)
+                             for cell, width in zip(row, _FAST_TABLE_WIDTHS)]
+                    com_table.add_row([cell.replace(u'|', _PIPE_STAND_IN) for cell in cells])
+                else:
+                    com_table.add_row(*row)
             caller.msg("|/|wAvailable channels|n:|/" +
                        "%s|/(Use |w/list|n, |w/join|n and |w/part|n to manage received channels.)" % com_table)
         elif 'join' in self.switches or 'on' in self.switches:
@@ -266,21 +292,21 @@ class CmdChannels(MuxAccountCommand):
                     caller.execute_cmd("@command/part %s" % channel.key)
             elif args == 'who':
                 # run a who, listing the subscribers on visible channels.
-                string = "\n|CChannel subscriptions|n"
+                parts = ["\n|CChannel subscriptions|n"]
                 channels = [chan for chan in ChannelDB.objects.get_all_channels()
                             if chan.access(caller, 'listen')]
                 if not channels:
-                    string += "No channels."
+                    parts.append("No channels.")
                 for channel in channels:
                     if not channel.access(self.caller, "control"):
                         continue
-                    string += "\n|w%s:|n\n" % channel.key
+                    parts.append("\n|w%s:|n\n" % channel.key)
                     subs = channel.db_subscriptions.all()
                     if subs:
-                        string += "  " + ", ".join([account.key for account in subs])
+                        parts.append("  " + ", ".join([account.key for account in subs]))
                     else:
-                        string += "  <None>"
-                self.msg(string.strip())
+                        parts.append("  <None>")
+                self.msg("".join(parts).strip())
             else:
                 # wrong input
                 self.msg("Usage: %s/all on | off | who | clear" % self.cmdstring)
@@ -325,13 +351,12 @@ class CmdChannels(MuxAccountCommand):
         else:  # just display the subscribed channels with no extra info
             com_table = evtable.EvTable("|wchannel|n", "|wmy aliases|n",
                                         "|wdescription|n", align="l", maxwidth=_DEFAULT_WIDTH)
+            nicks_by_key = channel_nicks(caller)
             for chan in subs:
                 c_lower = chan.key.lower()
-                nicks = caller.nicks.get(category="channel", return_obj=True)
-                com_table.add_row(*["%s%s" % (chan.key, chan.aliases.all() and
-                                    "(%s)" % ",".join(chan.aliases.all()) or ""),
-                                    "%s" % ",".join(nick.db_key for nick in make_iter(nicks)
-                                                    if nick and nick.strvalue.lower() == c_lower),
-                                    chan.db.desc])
+                chan_aliases = chan.aliases.all()
+                alias_str = "(%s)" % ",".join(chan_aliases) if chan_aliases else ''
+                com_table.add_row(chan.key + alias_str, ",".join(nicks_by_key.get(c_lower, ())),
+                                  chan.db.desc)
             caller.msg("\n|wChannel subscriptions|n (use |w@chan/list|n to list all, " +
                        "|w/join|n |w/part|n to join or part):|n\n%s" % com_table)
@@ -6,6 +6,7 @@ Commands describe the input the account can do to the world.
 
 """
 import time  # Check time since last activity
+from textwrap import dedent
 from evennia.utils import inherits_from
 from evennia import default_cmds
 from evennia import Command as BaseCommand
@@ -144,6 +145,13 @@ class MuxCommand(default_cmds.MuxCommand):
         """
         super(MuxCommand, self).func()
 
+    def show_help(self):
+        """
+        Send this command's help text straight to the caller,
+        instead of running the help command through the cmdhandler.
+        """
+        self.msg('|CHelp for |w%s|n|/%s' % (self.key, dedent(self.__doc__ or '').strip()))
+
     def at_post_cmd(self):
         """
         This hook is called after the command has finished executing
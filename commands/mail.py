@@ -2,10 +2,9 @@
 from commands.command import MuxCommand
 # from django.conf import settings
 from evennia import CmdSet
-from evennia.comms.models import ChannelDB, Msg
-from evennia.utils import create, utils, evtable, delay
+from evennia.comms.models import Msg
+from evennia.utils import create, utils
 # from evennia.utils.utils import make_iter, class_from_module
-from past.builtins import cmp
 
 
 class MailCmdSet(CmdSet):
@@ -60,7 +59,7 @@ class CmdMail(MuxCommand):
                     self.msg('Your %s mailbox has no new mail.' % char.location.get_display_name(self.character))
         if not self.args or not self.rhs:
             mail = sent_messages + recd_messages
-            mail.sort(lambda x, y: cmp(x.db_date_created, y.db_date_created))
+            mail.sort(key=lambda x: x.db_date_created)
             number = 5
             if self.args:
                 try:
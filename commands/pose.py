@@ -3,6 +3,10 @@ from commands.command import MuxCommand
 from world.helpers import escape_braces, substitute_objects
 from evennia.utils import ansi
 
+# Glyphs that remove the space between the poser's name and the pose.
+_POSE_MAGNETS_DISPLAY = ('®', '©', '°', '·', '~', '@', '-', "'", '’', ',', ';', ':', '.', '?', '!', '…')
+_POSE_MAGNETS = frozenset(_POSE_MAGNETS_DISPLAY)
+
 
 class CmdPose(MuxCommand):
     """
@@ -79,8 +83,11 @@ class CmdPose(MuxCommand):
     def func(self):
         """Basic pose, power pose, room posing - all in one"""
         cmd = self.cmdstring
-        opt = self.switches
-        args = unicode(self.args).strip()
+        opt = frozenset(self.switches)
+        reset = 'reset' in opt
+        quiet = 'silent' in opt or 'quiet' in opt
+        ooc = 'ooc' in opt
+        args = self.args.strip()
         lhs, rhs = self.lhs, self.rhs
         sess = self.session
         char = self.character
@@ -89,14 +96,13 @@ class CmdPose(MuxCommand):
         power = True if cmd in ('ppose', 'pp', 'p:') else False
         raw_pose = rhs if rhs and cmd == 'do' or power else args
         raw_pose = substitute_objects(raw_pose, char)
-        non_space_chars = ['®', '©', '°', '·', '~', '@', '-', "'", '’', ',', ';', ':', '.', '?', '!', '…']
-        magnet = True if raw_pose and raw_pose[0] in non_space_chars or cmd == ";" else False
+        magnet = True if raw_pose and raw_pose[0] in _POSE_MAGNETS or cmd == ";" else False
         doing = True if 'do' in cmd or 'rp' in cmd else False
         pose = ('' if magnet else '|_') + (ansi.strip_ansi(raw_pose) if doing else raw_pose)
         # ---- Setting Room poses as a doing message ----------
         if doing:  # Pose will have no markup when posing on the room, to minimize shenanigans.
             target = char  # Initially assume the setting character is the target.
-            if not args and 'reset' not in opt:
+            if not args and not reset:
                 has_pose = char.db.messages and char.db.messages.get('pose')
                 if has_pose:  # If target has poses set, display them to the setter.
                     char.msg("Current pose reads: '%s'" % target.get_display_name(char, pose=True))
@@ -119,7 +125,7 @@ class CmdPose(MuxCommand):
                     self.set_doing(char, pose, target)  # Try to set the pose of the target.
             else:  # pose self.
                 target = char
-            if 'reset' in opt:  # Clears current temp doing, reverts it to default.
+            if reset:  # Clears current temp doing, reverts it to default.
                 pose = target.db.messages and target.db.messages.get('pose_default', '')
                 if not target.db.messages:
                     target.db.messages = {}
@@ -130,16 +136,15 @@ class CmdPose(MuxCommand):
                 return  # Nothing more to do. Default never poses to room, just sets doing message.
             elif not rhs:
                 self.set_doing(char, pose)  # Setting temp doing message on the setter...
-                if args and not ('silent' in opt or 'quiet' in opt) and char is target:  # Allow set without posing
+                if args and not quiet and char is target:  # Allow set without posing
                     # FIXME: Do not execute the pose if not permitted to room pose it.
                     account.execute_cmd(';%s' % pose, session=sess)  # pose to the room like a normal pose would.
                     # return  # Having executed the pose in a different way, work in this command instance is done.
             char.msg("Pose now set to: '%s'" % target.get_display_name(char, pose=True))  # Display name with pose.
         else:  # ---- Action pose, not static Room Pose. ---------------------
-            if '|/' in pose:
-                pose = pose.split('|/', 1)[0]
+            pose = pose.partition('|/')[0]
             if 'magnet' in opt:
-                char.msg("Pose magnet glyphs are %s." % non_space_chars)
+                char.msg("Pose magnet glyphs are %s." % ' '.join(_POSE_MAGNETS_DISPLAY))
             if not (here and char):
                 if args:
                     account.execute_cmd('pub :%s' % pose, session=sess)
@@ -147,14 +152,13 @@ class CmdPose(MuxCommand):
                     self.msg('Usage: pose <message>   to pose to public channel.')
                 return
             if args:
-                if power and self.rhs and 'o' not in self.switches:
+                if power and self.rhs and 'o' not in opt:
                     char.ndb.power_pose = pose
                     account.execute_cmd(self.rhs, session=sess)
                 else:
-                    ooc = 'ooc' in self.switches
                     prepend_ooc = '[OOC] ' if ooc else ''
                     here.msg_contents(('%s{char}%s' % (prepend_ooc, escape_braces(pose)),
                                        {'type': 'pose', 'ooc': ooc}),
                                       from_obj=char, mapping=dict(char=char))
             else:
-                account.execute_cmd('help pose', session=sess)
+                self.show_help()
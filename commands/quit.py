@@ -32,6 +32,7 @@ class CmdQuit(MuxAccountCommand):
         char = self.character
         here = None if char is None else char.location
         sess = self.session
+        sessions = account.sessions.all()
         if 'qhome' in cmd or 'home' in opt and char and here:  # Go home before quitting.
             char.execute_cmd('home')
         reason = self.args.strip() + '(Quitting)'
@@ -39,7 +40,7 @@ class CmdQuit(MuxAccountCommand):
             bye += " ( |w%s|n ) " % reason
         boot = ('bootme' in cmd) or 'boot' in opt
         if 'all' in opt or boot:
-            for session in account.sessions.all():
+            for session in sessions:
                 if boot:
                     if session is sess:
                         continue  # Exclude booting current session
@@ -52,11 +53,11 @@ class CmdQuit(MuxAccountCommand):
             if boot:
                 self.msg(bye + 'all other sessions. |gThis session remains connected.|n')
         else:
-            session_count = len(account.sessions.all())
+            session_count = len(sessions)
             online = utils.time_format(time.time() - sess.conn_time, 1)
             if session_count == 2:
                 msg = bye
-                others = [x for x in self.account.sessions.get() if x is not sess]
+                others = [x for x in sessions if x is not sess]
                 self.msg(msg + 'after ' + online + ' online.')
                 self.msg(msg + 'your other session. |gThis session remains connected.|n', session=others)
             elif session_count > 2:
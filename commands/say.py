@@ -5,6 +5,10 @@ from evennia.utils import ansi
 from evennia.utils.utils import pad, justify
 from world.helpers import escape_braces, substitute_objects
 
+_NON_DIGITS = re.compile(r'\D')
+_SPOOF_ESCAPE = re.compile(r'[|{}]')  # Doubled to show markup and braces literally.
+_OOC_PREFIX = {'"': 'say/o ', "'": 'say/o ', ':': 'pose/o ', ';': 'pose/o '}  # ooc prefix: command run
+
 
 class CmdSay(MuxCommand):
     """
@@ -31,12 +35,12 @@ class CmdSay(MuxCommand):
         args = self.args.strip()
         if not (here and char):
             if args:
-                account.execute_cmd('pub %s' % args, session=ses)
+                account.execute_cmd('pub %s' % args, session=sess)
             else:
                 self.msg('Usage: say <message>   to speak on public channel.')
             return
         if not args:
-            account.execute_cmd("help say", session=sess)
+            self.show_help()
             return
         if 'verb' in opt:
             char.attributes.add('say-verb', args)
@@ -50,23 +54,24 @@ class CmdSay(MuxCommand):
                 return
         else:
             speech = substitute_objects(args, char)
-            verb = char.attributes.get('say-verb') if char.attributes.has('say-verb') else 'says'
-            say_prepend = char.db.messages and char.db.messages.get('say prepend')
-            prepend = say_prepend if say_prepend else '|w'
+            verb = char.attributes.get('say-verb', default='says')
+            messages = char.db.messages or {}
+            prepend = messages.get('say prepend') or '|w'
+            speech = escape_braces(speech)
+            name = char.get_display_name(here) if here.has_account else None
             if 'ooc' in opt:
-                here.msg_contents(text=('[OOC] {char} says, |n"|w%s|n"' % escape_braces(speech),
+                here.msg_contents(text=('[OOC] {char} says, |n"|w%s|n"' % speech,
                                         {'type': 'say', 'ooc': True}), from_obj=char, mapping=dict(char=char))
-                if here.has_account:
-                    here.msg(text=('[OOC] %s says, |n"|w%s|n"' % (char.get_display_name(here), escape_braces(speech)),
+                if name:
+                    here.msg(text=('[OOC] %s says, |n"|w%s|n"' % (name, speech),
                                    {'type': 'say', 'ooc': True}), from_obj=char)
             else:
-                here.msg_contents(text=('{char} %s, |n"%s%s|n"' % (escape_braces(verb), escape_braces(prepend),
-                                                                   escape_braces(speech)),
+                verb, prepend = escape_braces(verb), escape_braces(prepend)
+                here.msg_contents(text=('{char} %s, |n"%s%s|n"' % (verb, prepend, speech),
                                         {'type': 'say'}), from_obj=char, mapping=dict(char=char))
-                if here.has_account:
-                    here.msg(text=('From inside you, %s %s, |n"%s%s|n"' %
-                                   (char.get_display_name(here), escape_braces(verb), escape_braces(prepend),
-                                    escape_braces(speech)), {'type': 'say'}), from_obj=char)
+                if name:
+                    here.msg(text=('From inside you, %s %s, |n"%s%s|n"' % (name, verb, prepend, speech),
+                                   {'type': 'say'}), from_obj=char)
 
 
 class CmdOoc(MuxCommand):
@@ -90,18 +95,17 @@ class CmdOoc(MuxCommand):
         here = char.location
         args = self.args.strip()
         if not args:
-            account.execute_cmd('help ooc', session=sess)
+            self.show_help()
             return
-        elif args[0] == '"' or args[0] == "'":
-            account.execute_cmd('say/o ' + args[1:], session=sess)
-        elif args[0] == ':' or args[0] == ';':
-            account.execute_cmd('pose/o %s' % args[1:], session=sess)
+        prefix = _OOC_PREFIX.get(args[0])
+        if prefix:
+            account.execute_cmd(prefix + args[1:], session=sess)
         else:
-            here.msg_contents(text=('[OOC {char}] %s' % escape_braces(args), {'type': 'ooc', 'ooc': True}),
+            args = escape_braces(args)
+            here.msg_contents(text=('[OOC {char}] %s' % args, {'type': 'ooc', 'ooc': True}),
                               from_obj=char, mapping=dict(char=char))
             if here.has_account:
-                here.msg(text=('[OOC %s] %s' %
-                               (char.get_display_name(here), escape_braces(args)),
+                here.msg(text=('[OOC %s] %s' % (char.get_display_name(here), args),
                                {'type': 'ooc', 'ooc': True}), from_obj=char)
 
 
@@ -130,26 +134,24 @@ class CmdSpoof(MuxCommand):
         char = self.character
         cmd = self.cmdstring
         here = char.location
-        opt = self.switches
+        opt = frozenset(self.switches)
+        right, center, news = 'right' in opt, 'center' in opt, 'news' in opt
         args = self.args
         to_self = 'self' in opt or not here
         if not args:
-            self.account.execute_cmd('help spoof', session=self.session)
+            self.show_help()
             return
-        # Optionally strip any markup /or/ just escape it,
-        stripped = ansi.strip_ansi(args)
-        spoof = stripped if 'strip' in opt else args.replace('|', '||')
         if 'indent' in opt:
             indent = 20
             if self.rhs:
                 args = self.lhs.strip()
-                indent = re.sub("[^0123456789]", '', self.rhs) or 20
+                indent = _NON_DIGITS.sub('', self.rhs) or 20
                 indent = int(indent)
             if to_self:
                 char.msg(' ' * indent + args.rstrip())
             else:
                 here.msg_contents(text=(' ' * indent + escape_braces(args.rstrip()), {'type': 'spoof'}))
-        elif 'right' in opt or 'center' in opt or 'news' in opt:  # Use Justify
+        elif right or center or news:  # Use Justify
             if self.rhs is not None:  # Equals sign exists.
                 parameters = '' if not self.rhs else self.rhs.split()
                 args = self.lhs.strip()
@@ -158,40 +160,36 @@ class CmdSpoof(MuxCommand):
                         outside, inside = self.rhs.split()
                     else:
                         outside, inside = [parameters[0], parameters[1]]
-                    outside = re.sub("[^0123456789]", '', outside) or 0
-                    inside = re.sub("[^0123456789]", '', inside) or 0
+                    outside = _NON_DIGITS.sub('', outside) or 0
+                    inside = _NON_DIGITS.sub('', inside) or 0
                     outside, inside = [int(max(outside, inside)), int(min(outside, inside))]
                 else:
                     outside, inside = [72, 20]
             else:
                 outside, inside = [72, min(int(self.rhs or 72), 20)]
-            block = 'l'
-            if 'right' in opt:
-                block = 'r'
-            elif 'center' in opt:
-                block = 'c'
-            elif 'news' in opt:
-                block = 'f'
-            for text in justify(args, width=outside, align=block, indent=inside).split('\n'):
-                if to_self:
-                    char.msg(text.rstrip())
-                else:
-                    here.msg_contents(text=(escape_braces(text.rstrip()), {'type': 'spoof'}))
+            block = 'r' if right else 'c' if center else 'f'
+            text = '\n'.join(line.rstrip() for line in
+                              justify(args, width=outside, align=block, indent=inside).split('\n'))
+            if to_self:
+                char.msg(text)
+            else:
+                here.msg_contents(text=(escape_braces(text), {'type': 'spoof'}))
         else:
             if 'strip' in opt:  # Optionally strip any markup or escape it,
+                spoof = ansi.strip_ansi(args).rstrip()
                 if to_self:
-                    char.msg(spoof.rstrip(), options={'raw': True})
+                    char.msg(spoof, options={'raw': True})
                 else:
-                    here.msg_contents(text=(escape_braces(spoof.rstrip()), {'type': 'spoof'}), options={'raw': True})
+                    here.msg_contents(text=(escape_braces(spoof), {'type': 'spoof'}), options={'raw': True})
             elif '.' in cmd:  # Leave leading spacing intact by using self.raw and not stripping left whitespace
                 # Adding <pre> and </pre> to all output in case one of the viewers is using webclient
-                spoof = self.raw.rstrip()
+                spoof = '<code>%s</code>' % self.raw.rstrip()
                 if to_self:
-                    char.msg(('<code>' + spoof + '</code>', {'type': 'spoof'}), options={'raw': True})
+                    char.msg((spoof, {'type': 'spoof'}), options={'raw': True})
                 else:
-                    here.msg_contents(text=('<code>' + spoof + '</code>', {'type': 'spoof'}), options={'raw': True})
+                    here.msg_contents(text=(spoof, {'type': 'spoof'}), options={'raw': True})
             else:
                 if to_self:
                     char.msg(args.rstrip())
                 else:
-                    here.msg_contents(text=(escape_braces(spoof.rstrip()), {'type': 'spoof'}))
+                    here.msg_contents(text=(_SPOOF_ESCAPE.sub(r'\g<0>\g<0>', args.rstrip()), {'type': 'spoof'}))
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from commands.command import MuxCommand
+from commands.verb import lock_elements
 from django.conf import settings
 from evennia import utils
 
@@ -113,14 +114,11 @@ class CmdSense(MuxCommand):
                         verb_msg = "%s responds to: " % obj.get_display_name(account)
                     else:
                         verb_msg = "%sYou|n respond to: " % char.STYLE
-                    verbs = obj.locks
                     collector_list = []
                     show_red = True if obj.access(char, 'examine') else False
-                    for verb in ("%s" % verbs).split(';'):
-                        element = verb.split(':')[0]
+                    for element, name in lock_elements(str(obj.locks)):
                         if element == 'call':
                             continue
-                        name = element[2:] if element[:2] == 'v-' else element
                         if obj.access(char, element):  # obj lock checked against actor
                             collector_list.append("|lctry %s %s|lt|g%s|n|le " %
                                                   (name, obj.get_display_name(char, plain=True), name))
@@ -1,9 +1,20 @@
 # -*- coding: utf-8 -*-
+import re
 from commands.command import MuxCommand
 from evennia import syscmdkeys, Command
 from evennia.utils.utils import string_suggestions
 from world.verbs import VerbHandler
 
+_VERB_RE = re.compile(r'(?:^|;)(v-)?([^:;]+):')  # Access type of each lock, with optional verb prefix
+
+
+def lock_elements(lockstring):
+    """
+    Split a lock string into (access type, verb name) pairs
+    in a single regex pass.
+    """
+    return [(prefix + name, name) for prefix, name in _VERB_RE.findall(lockstring)]
+
 
 class CmdTry(MuxCommand):
     """
@@ -88,10 +99,7 @@ class CmdTry(MuxCommand):
         here = char.location
         surroundings = ([here] + here.contents + char.contents) if here else ([char] + char.contents)
         for obj in surroundings:
-            verbs = obj.locks
-            for verb in ("%s" % verbs).split(';'):
-                element = verb.split(':')[0]
-                name = element[2:] if element[:2] == 'v-' else element
+            for element, name in lock_elements(str(obj.locks)):
                 if not obj.access(char, element):  # search_verb on object is inaccessible.
                     continue
                 if name == search_verb:
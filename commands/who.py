@@ -3,7 +3,9 @@ import time
 from commands.command import MuxAccountCommand
 from django.conf import settings
 from evennia.server.sessionhandler import SESSIONS
-from evennia.utils import ansi, utils, create, search, evtable
+from evennia.utils import utils, evtable, evmore
+
+_WHO_ROW_CAP = 200  # Most session rows shown in one who listing without /full
 
 
 class CmdWho(MuxAccountCommand):
@@ -23,10 +25,11 @@ class CmdWho(MuxAccountCommand):
     /idle    - sort table by idle time
     /reverse - sort in reverse order
     /exact   - Only match exact when filtering
+    /full    - (Helpstaff) list every session, paged
     """
     key = 'who'
     aliases = ['ws', 'where', 'wa', 'what', 'wot']
-    switch_options = ('alpha', 'on', 'idle', 'reverse', 'exact')
+    switch_options = ('alpha', 'on', 'idle', 'reverse', 'exact', 'full')
     arg_regex = None
     locks = 'cmd:all()'
 
@@ -35,22 +38,28 @@ class CmdWho(MuxAccountCommand):
         you = self.account
         opt = self.switches
         args = self.args
-        session_list = SESSIONS.get_sessions()
+        now = time.time()
+        session_list = [sess for sess in SESSIONS.get_sessions() if sess.logged_in]
         notice = ''
         if args:
             char = self.caller.get_puppet(self.session)
+            puppets = [(sess, sess.get_puppet()) for sess in session_list]
             if 'exact' in opt:
-                session_list = [sess for sess in session_list if sess.get_puppet()
-                                and sess.get_puppet().get_display_name(char, plain=True) == args]
+                session_list = [sess for sess, puppet in puppets if puppet
+                                and puppet.get_display_name(char, plain=True) == args]
                 notice = '  Showing exact matches for "{}"'.format(args)
             else:
                 args = args.lower()
-                session_list = [sess for sess in session_list if sess.get_puppet()
-                                and sess.get_puppet().get_display_name(char, plain=True).lower().startswith(args)]
+                session_list = [sess for sess, puppet in puppets if puppet
+                                and puppet.get_display_name(char, plain=True).lower().startswith(args)]
                 notice = '  Showing matches that begin with "{}"'.format(args)
         sessions_using_puppets = [sess for sess in session_list if sess.get_puppet()]
         cmd = self.cmdstring
         show_session_data = you.check_permstring('immortal') and not you.attributes.has('_quell')
+        show_all = 'full' in opt and you.check_permstring('helpstaff')
+        if 'full' in opt and not show_all and cmd not in ('wa', 'where', 'ws'):  # where and ws are never capped
+            self.msg('You need Helpstaff permission to use |w/full|n. Showing at most %i sessions.' % _WHO_ROW_CAP)
+        hidden = 0  # Count of session rows left out by the row cap
         table = evtable.EvTable(border='none', pad_width=0, border_width=0, maxwidth=79)
         if cmd == 'wa' or cmd == 'where':
             # Example output expected:
@@ -71,9 +80,7 @@ class CmdWho(MuxAccountCommand):
             sessions_using_puppets = self.option_sort(sessions_using_puppets, 'alpha')
             for session in sessions_using_puppets:  # Go through connected list and see who's where.
                 character = session.get_puppet()
-                if character.location not in locations:
-                    locations[character.location] = []
-                locations[character.location].append(character)  # Build the list of who's in a location
+                locations.setdefault(character.location, []).append(character)  # Build the list of who's in a location
             for place in locations:
                 location = place.get_display_name(you) if place else (settings.NOTHINGNESS + '|n')
                 table.add_row(len(locations[place]), location, '?',
@@ -88,27 +95,30 @@ class CmdWho(MuxAccountCommand):
             table.reformat_column(0, width=45, align='l')
             table.reformat_column(1, width=8, align='l')
             table.reformat_column(2, width=7, pad_right=1, align='r')
-            for element in my_character.location.contents:
-                if not element.has_account:
-                    continue
-                delta_cmd = time.time() - max([each.cmd_last_visible for each in element.sessions.all()])
-                delta_con = time.time() - min([each.conn_time for each in element.sessions.all()])
+            characters = [element for element in my_character.location.contents if element.has_account]
+            for element in characters:
+                sessions = element.sessions.all()
+                delta_cmd = now - max([each.cmd_last_visible for each in sessions])
+                delta_con = now - min([each.conn_time for each in sessions])
                 name = element.get_display_name(you)
-                type = element.db.messages and element.db.messages.get('species') or ''
-                gend = element.db.messages and element.db.messages.get('gender') or ''
+                messages = element.db.messages or {}
+                type = messages.get('species') or ''
+                gend = messages.get('gender') or ''
                 fill = ' ' if gend else ''
                 table.add_row(name + ', ' + gend.lower() + fill + type if type else name,
                               utils.time_format(delta_con, 0), utils.time_format(delta_cmd, 1))
         elif cmd == 'what' or cmd == 'wot':
             session_list = self.option_sort(sessions_using_puppets, 'idle', True)
+            if not show_all:
+                session_list, hidden = session_list[:_WHO_ROW_CAP], max(0, len(session_list) - _WHO_ROW_CAP)
             table.add_header('|wCharacter  - Doing', '|wIdle')
             table.reformat_column(0, width=72, align='l')
             table.reformat_column(1, width=7, align='r')
             for session in session_list:
                 character = session.get_puppet()
-                if not session.logged_in or not character:
+                if not character:
                     continue
-                delta_cmd = time.time() - session.cmd_last_visible
+                delta_cmd = now - session.cmd_last_visible
                 doing = character.get_display_name(you, pose=True)
                 table.add_row(doing, utils.time_format(delta_cmd, 1))
         else:  # Default to displaying who
@@ -120,6 +130,10 @@ class CmdWho(MuxAccountCommand):
                 table.reformat_column(3, width=6, pad_right=1, align='r')
                 table.reformat_column(4, width=11, align='l')
                 table.reformat_column(5, width=16, align='r')
+                session_list = sorted(session_list,
+                                      key=lambda sess: (sess.get_puppet() or sess.get_account()).key.lower())
+                if not show_all:
+                    session_list, hidden = session_list[:_WHO_ROW_CAP], max(0, len(session_list) - _WHO_ROW_CAP)
                 for session in session_list:
                     account = session.get_account()
                     puppet = session.get_puppet()
@@ -130,18 +144,18 @@ class CmdWho(MuxAccountCommand):
                                   session.cmd_total, session.protocol_key, address)
             else:  # unprivileged info shown to everyone, including Immortals and higher when quelled
                 session_list = self.option_sort(sessions_using_puppets, 'alpha')
+                if not show_all:
+                    session_list, hidden = session_list[:_WHO_ROW_CAP], max(0, len(session_list) - _WHO_ROW_CAP)
                 table.add_header('|wCharacter', '|wOn for', '|wIdle')
                 table.reformat_column(0, width=40, align='l')
                 table.reformat_column(1, width=8, align='l')
                 table.reformat_column(2, width=7, align='r')
                 for session in session_list:
-                    if not session.logged_in:
-                        continue
                     character = session.get_puppet()
                     if not character:
                         continue
-                    delta_cmd = time.time() - session.cmd_last_visible
-                    delta_conn = time.time() - session.conn_time
+                    delta_cmd = now - session.cmd_last_visible
+                    delta_conn = now - session.conn_time
                     table.add_row(character.get_display_name(you), utils.time_format(delta_conn, 0),
                                   utils.time_format(delta_cmd, 1))
         account_count = (SESSIONS.account_count())
@@ -150,7 +164,12 @@ class CmdWho(MuxAccountCommand):
         string += ' single ' if is_one else ' unique '
         plural = ' is' if is_one else 's are'
         string += 'account%s logged in.' % plural
-        self.msg(unicode(table))
+        if hidden:
+            notice += '  ... (%i more)' % hidden
+        if show_all:
+            evmore.msg(self.caller, unicode(table), session=self.session)
+        else:
+            self.msg(unicode(table))
         self.msg(string + notice)
 
     def option_sort(self, to_sort, sort_type='alpha', reverse=False):
@@ -44,7 +44,10 @@ the function; this is the session of the object viewing the string
 and can be used to customize it to each session.
 
 """
-from random import *  # For the usage, using random
+from random import random as _rand  # For the usage, using random
+
+# limit symbol import for API
+__all__ = ('capitalize', 'usage', 'annotate', 'uni', 'affect')
 
 
 def capitalize(text, *args, **kwargs):
@@ -54,8 +57,7 @@ def capitalize(text, *args, **kwargs):
 
 def usage(text, *args, **kwargs):
     """Verbally describes how busy an area is"""
-    text += ' quiet' if random() > 0.5 else ' busy'
-    return text
+    return text + (' quiet' if _rand() > 0.5 else ' busy')
 
 
 def annotate(text, *args, **kwargs):
@@ -63,14 +65,9 @@ def annotate(text, *args, **kwargs):
     ex. $annotate(original, annotation) or
         $annotate(original) for no annotation."""
     session = kwargs.get('session')
-    nargs = len(args)
-    note = ''
-    original = ''
-
-    if nargs > 0:
-        note = args[0]
-        original = text
-    return note if session.protocol_flags['SCREENREADER'] else original
+    if not args:
+        return ''
+    return args[0] if session and session.protocol_flags.get('SCREENREADER') else text
 
 
 def uni(text, *args, **kwargs):
@@ -78,14 +75,9 @@ def uni(text, *args, **kwargs):
     ex. $uni(original, unicode) or
         $uni(original) for no annotation."""
     session = kwargs.get('session')
-    nargs = len(args)
-    u = ''
-    o = ''
-
-    if nargs > 0:
-        u = unicode(args[0])
-        o = text
-    return u if session.protocol_flags['ENCODING'] == 'utf-8' else o
+    if not args:
+        return ''
+    return args[0] if session and session.protocol_flags.get('ENCODING') == 'utf-8' else text
 
 
 def affect(text, *args, **kwargs):
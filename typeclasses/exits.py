@@ -269,11 +269,11 @@ class CmdContinue(Command):
         if caller.ndb.currently_moving:
             caller.msg("You are already moving toward %s." % destination.get_display_name(caller))
         else:
+            dest_name = destination.get_display_name(caller)
             caller.location.msg_contents("%s is going to %s." %
-                                         (caller.get_display_name(caller.sessions),
-                                          destination.get_display_name(caller.sessions)), exclude=caller)
+                                         (caller.get_display_name(caller), dest_name), exclude=caller)
             caller.msg("You begin %s toward %s." % (SPEED_DESCS[caller.db.move_speed],  # TODO use Traits
-                                                    destination.get_display_name(caller.sessions)))
+                                                    dest_name))
             if caller.move_to(destination, quiet=False):
                 start.at_after_traverse(caller, start)
 
@@ -325,10 +325,10 @@ class CmdBack(Command):
                         char.move_to(last_room)
             else:  # No way back, try out.
                 if start:
-                    char.msg("You leave %s." % here.get_display_name(char.sessions))
+                    char.msg("You leave %s." % here.get_display_name(char))
                     char.move_to(start)
                 else:
-                    char.msg("You can not leave %s." % here.get_display_name(char.sessions))
+                    char.msg("You can not leave %s." % here.get_display_name(char))
             return
         elif char.ndb.currently_moving:  # If you are inside an exit,
             char.execute_cmd('stop')  # traveling, then stop, go back.
@@ -9,13 +9,11 @@ so by editing the Tangible class in tangibles.py.
 """
 from evennia import DefaultObject
 from typeclasses.tangibles import Tangible
-from evennia.utils.utils import lazy_property
-from traits import TraitHandler
-from evennia.utils.evmenu import get_input
 from world.helpers import make_bar, mass_unit
-from commands.poll import PollCmdSet
 from django.conf import settings
 
+_MISSING = object()  # Default for dict lookups where None is a valid value
+
 
 class Junk(DefaultObject):
     """A minimal object - not intended to be tangible."""
@@ -202,7 +200,7 @@ class Object(Tangible):
         if not self.location:
             return True  # Avoids being locked in Nothingness.
         # When self is supporting something, do not move it.
-        return False if self.attributes.has('locked') and self.db.locked else True
+        return not self.attributes.get('locked')
 
     def announce_move_from(self, destination):
         """
@@ -212,8 +210,8 @@ class Object(Tangible):
         Args:
             destination (Object): The place we are going to.
         """
-        if not self.location:
-            return
+        if not self.location or len(self.location.contents) < 2:
+            return  # Nowhere to announce, or nobody else here to hear it.
         name = self.name
         loc_name = self.location.name
         dest_name = destination.name
@@ -238,6 +236,8 @@ class Object(Tangible):
             return
         if there is here:  # No distance traveled, no announce.
             return
+        if len(here.contents) < 2:  # Nobody else here to hear it.
+            return
         if there:  # Travelled from somewhere
             string = "|g%s|n arrives to %s%s|n from %s%s|n." % (this, here.STYLE, here.key, there.STYLE, there.key)
         else:  # Travelled from nowhere
@@ -277,15 +277,14 @@ class Object(Tangible):
     def surface_off(self, pose, caller):
         """Implements the surface disconnection of object by caller."""
         surface = self.db.surface
-        if caller in surface:
-            del(surface[caller])
-            self.db.surface = surface
-            if len(surface) < 1:
-                self.attributes.remove('locked')
-            caller.attributes.remove('locked')
-            caller.location.msg_contents("%s|r%s|n leaves %s%s|n." % (pose, caller.key, self.STYLE, self.key))
-            return True
-        return False
+        # Saved by the attribute's own dict; no need to reassign.
+        if not surface or surface.pop(caller, _MISSING) is _MISSING:
+            return False
+        if len(surface) < 1:
+            self.attributes.remove('locked')
+        caller.attributes.remove('locked')
+        caller.location.msg_contents("%s|r%s|n leaves %s%s|n." % (pose, caller.key, self.STYLE, self.key))
+        return True
 
     def process_sdesc(self, sdesc, obj, **kwargs):
         """
@@ -313,42 +312,40 @@ class Object(Tangible):
         """
         if not viewer:
             return None
-        # get and identify all objects
-        visible = (con for con in self.contents if con != viewer and con.access(viewer, "view"))
+        # get, identify and name all visible objects in one pass
         exits, users, things = [], [], []
-        for con in visible:
+        quelled = bool(viewer.account and viewer.account.attributes.has('_quell'))
+        for con in self.contents:
+            if con is viewer or not con.access(viewer, "view"):
+                continue
+            name = con.get_display_name(viewer, quelled=quelled)
             if con.destination:
-                exits.append(con)
+                exits.append(name)
             elif con.has_account:
-                users.append(con)
+                users.append(name)
             else:
-                things.append(con)
+                things.append(name)
         # get description, build string
-        string = self.get_display_name(viewer, mxp='sense #%s' % self.id)
-        string += " (%s)" % mass_unit(self.get_mass())
+        parts = [self.get_display_name(viewer, mxp='sense #%s' % self.id),
+                 " (%s)" % mass_unit(self.get_mass())]
         if self.traits.health:  # Add health bar if object has health.
             gradient = ["|[300", "|[300", "|[310", "|[320", "|[330", "|[230", "|[130", "|[030", "|[030"]
             health = make_bar(self.traits.health.actual, self.traits.health.max, 20, gradient)
-            string += " %s\n" % health
-        if self.db.surface:
-            string += " -- %s" % self.db.surface
-        string += "\n"
-        desc = self.db.desc
-        desc_brief = self.db.desc_brief
+            parts.append(" %s\n" % health)
+        surface = self.db.surface
+        if surface:
+            parts.append(" -- %s" % surface)
+        parts.append("\n")
+        desc = self.db.desc or self.db.desc_brief
         if desc:
-            string += "%s" % desc
-        elif desc_brief:
-            string += "%s" % desc_brief
+            parts.append("%s" % desc)
         else:
-            string += 'A shimmering illusion of %s shifts from form to form.' % self.name
+            parts.append('A shimmering illusion of %s shifts from form to form.' % self.name)
         if exits:
-            string += "\n|wExits: " + ", ".join("%s" % e.get_display_name(viewer) for e in exits)
+            parts.append("\n|wExits: " + ", ".join(exits))
         if users or things:
-            user_list = ", ".join(u.get_display_name(viewer) for u in users)
-            ut_joiner = ', ' if users and things else ''
-            item_list = ", ".join(t.get_display_name(viewer) for t in things)
-            string += "\n|wContains:|n " + user_list + ut_joiner + item_list
-        return string
+            parts.append("\n|wContains:|n " + ", ".join(users + things))
+        return "".join(parts)
 
 
 class Consumable(Object):  # TODO: State and analog decay. (State could be discrete analog?)
@@ -367,51 +364,57 @@ class Consumable(Object):  # TODO: State and analog decay. (State could be discr
             self.traits.health.current -= 1
         return self.traits.health.actual
 
-    def drink(self, caller):  # TODO: Make this use a more generic def consume
-        """Response to drinking the object."""
+    def _consume(self, caller, action, finish_removes):
+        """
+        Shared part of eating and drinking: check self is held, use up
+        one health, and tell the room.
+
+        Args:
+            caller (Object): the one consuming self.
+            action (str): what caller does, for example "takes a bite of".
+            finish_removes (bool): remove self when this use finishes it.
+
+        Returns:
+            False if caller is not holding self, else True.
+        """
         if not self.locks.check_lockstring(caller, 'holds()'):
-            msg = "You are not holding %s." % self.get_display_name(caller.sessions)
-            caller.msg(msg)
+            caller.msg("You are not holding %s." % self.get_display_name(caller))
             return False
         finish = ''
         if self.traits.health.actual:
-            self.traits.health.current -= 1
-            if self.traits.health.actual < 1:
+            if self.consume(caller) < 1:
                 finish = ', finishing it'
-                # self.location = None # Leaves empty container.
+                if finish_removes:
+                    self.location = None
         else:
             finish = ', finishing it'
             self.location = None
-        caller.location.msg_contents('{caller} takes a drink of {drink}%s.'
-                                     % finish, from_obj=caller, mapping=dict(char=caller, drink=self))
+        caller.location.msg_contents("%s%s|n %s %s%s|n%s." %
+                                     (caller.STYLE, caller.key, action, self.STYLE, self.key, finish))
+        return True
+
+    def drink(self, caller):
+        """Response to drinking the object."""
+        from evennia.utils.evmenu import get_input  # Import the input prompt just before using it.
+        if not self._consume(caller, 'takes a drink of', False):  # Finishing leaves empty container.
+            return False
+        obj_name = self.get_display_name(caller)
+        caller_name = caller.get_display_name(caller)
 
         def drink_callback(caller, prompt, user_input):
             """"Response to input given after drink potion"""
             msg = "%s begins to have an effect on %s, transforming into species %s." %\
-                  (self.get_display_name(caller.sessions), caller.get_display_name(caller.sessions), user_input)
+                  (obj_name, caller_name, user_input)
             caller.location.msg_contents(msg)
             caller.db.species = user_input[0:20].strip()
 
         get_input(caller, "Species? (Type your species setting now, and then [enter]) ", drink_callback)
         return True
 
-    def eat(self, caller):  # TODO: Make this use a more generic def consume
+    def eat(self, caller):
         """Response to eating the object."""
-        if not self.locks.check_lockstring(caller, 'holds()'):
-            msg = "You are not holding %s." % self.get_display_name(caller.sessions)
-            caller.msg(msg)
+        if not self._consume(caller, 'takes a bite of', True):
             return False
-        finish = ''
-        if self.traits.health.actual:
-            self.traits.health.current -= 1
-            if self.traits.health.actual < 1:
-                finish = ', finishing it'
-                self.location = None
-        else:
-            finish = ', finishing it'
-            self.location = None
-        msg = "%s%s|n takes a bite of %s%s|n%s." % (caller.STYLE, caller.key, self.STYLE, self.key, finish)
-        caller.location.msg_contents(msg)
         return None
 
 
@@ -54,6 +54,7 @@ class Tangible(DefaultObject):
             mxp Return includes mxp command markup prefix if provided
             db_id Return includes database id to privileged viewers if True
             plain Return does not include database id or color
+            quelled Whether viewer's account is quelled, if already known
         Returns:
             name (str): A string of the sdesc containing the name of the object,
             if this is defined.
@@ -70,11 +71,15 @@ class Tangible(DefaultObject):
         mxp, db_id = [kwargs.get('mxp', False), kwargs.get('db_id', True)]
         if kwargs.get('plain', False):  # "plain" means "without color, without db_id"
             color, db_id = [False, False]
-        display_name = ("%s%s|n" % (self.STYLE, name)) if color else name
+        display_name = (self.STYLE + name + '|n') if color else name
         if mxp:
-            display_name = "|lc%s|lt%s|le" % (mxp, display_name)
-        if not viewer.account.attributes.has('_quell') and self.access(viewer, access_type='control') and db_id:
-            display_name += '|w(#%s)|n' % self.id
+            display_name = '|lc' + mxp + '|lt' + display_name + '|le'
+        if db_id:
+            quelled = kwargs.get('quelled')
+            if quelled is None:
+                quelled = viewer.account.attributes.has('_quell')
+            if not quelled and self.access(viewer, access_type='control'):
+                display_name += '|w(#%s)|n' % self.id
         if pose and self.db.messages and (self.db.messages.get('pose') or self.db.messages.get('pose_default')):
             display_pose = self.db.messages.get('pose') if self.db.messages.get('pose', None)\
                 else self.db.messages.get('pose_default')
@@ -82,10 +87,22 @@ class Tangible(DefaultObject):
         return display_name
 
     def get_mass(self):
+        """
+        Mass of self plus everything contained, added up by walking
+        the containment tree with a stack rather than by recursion.
+        """
         mass = self.traits.mass.actual if self.traits.mass else 0
         if mass <= 0 and self.tags.get('weightless', category='flags'):
             return mass  # Ignore mass of contents if this tangible is weight-free or inert.
-        return reduce(lambda x, y: x+y.get_mass() if hasattr(y, 'get_mass') else 0, [mass] + self.contents)
+        stack = [each for each in self.contents if hasattr(each, 'get_mass')]
+        while stack:
+            obj = stack.pop()
+            obj_mass = obj.traits.mass.actual if obj.traits.mass else 0
+            mass += obj_mass
+            if obj_mass <= 0 and obj.tags.get('weightless', category='flags'):
+                continue
+            stack.extend(each for each in obj.contents if hasattr(each, 'get_mass'))
+        return mass
 
     def get_limit(self):
         # TODO: Apply health as a small factor.
@@ -3,6 +3,10 @@ Helpers
 
 Methods that are helpful to have in a module.
 """
+import re
+
+_WORD = re.compile(r'\S+', re.UNICODE)  # Same words as unicode.split()
+_MARKED = re.compile(r'(?:^|\s)/', re.UNICODE)  # A word starting with /
 
 
 def make_bar(value, maximum, length, gradient):
@@ -19,8 +23,22 @@ def make_bar(value, maximum, length, gradient):
     return barstring[:int(length) + 13] + "|n"
 
 
+_MASS_UNITS = {}  # Memo of mass_unit results, keyed by value
+_MASS_UNITS_MAX = 1024
+
+
 def mass_unit(value):
     """Present a suitable mass unit based on value"""
+    unit = _MASS_UNITS.get(value)
+    if unit is None:
+        if len(_MASS_UNITS) >= _MASS_UNITS_MAX:
+            _MASS_UNITS.clear()
+        unit = _MASS_UNITS[value] = _format_mass(value)
+    return unit
+
+
+def _format_mass(value):
+    """Format value as a mass with a suitable unit"""
     if not value:
         return 'unknown'
     value = float(value)
@@ -48,21 +66,22 @@ def escape_braces(text):
 
 
 def substitute_objects(text, puppet):
-    if '/' not in text:
+    if '/' not in text or not _MARKED.search(text):
         return text
     candidates = [puppet] + puppet.contents
     if puppet.location:
         candidates = list(set(candidates + [puppet.location] + puppet.location.contents +
                               (puppet.location.db.hosted.keys() if puppet.location.db.hosted else [])))
-    return_text = []
-    for each in text.split():
+    found = {}  # Search results by search word, so repeated words are only searched once.
+
+    def substitute(word):
+        each = word.group(0)
         match = None
         new_each = each
         word_end = ''
         if each.startswith('/'):  # A possible substitution to test
             if each.endswith('/'):  # Skip this one, it's /italic/
-                return_text.append(new_each)
-                continue
+                return new_each
             search_word = each[1:]
             if search_word.startswith('/'):  # Skip this one, it's being escaped
                 new_each = each[1:]
@@ -71,6 +90,9 @@ def substitute_objects(text, puppet):
                     pass
                 if each[-1] in ".,!?":
                     search_word, word_end = search_word[:-1], each[-1]
-                match = puppet.search(search_word, quiet=True, candidates=candidates)
-        return_text.append(new_each if not match else (match[0].get_display_name(puppet) + word_end))
-    return ' '.join(return_text)
+                key = search_word.lower()
+                if key not in found:
+                    found[key] = puppet.search(search_word, quiet=True, candidates=candidates)
+                match = found[key]
+        return new_each if not match else (match[0].get_display_name(puppet) + word_end)
+    return _WORD.sub(substitute, text)